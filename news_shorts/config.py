@@ -145,6 +145,49 @@ SUMMARY_FILE = os.path.join(OUTPUT_DIR, "daily_summary.mp4")
 os.makedirs(AUDIO_DIR, exist_ok=True)
 os.makedirs(HINDI_AUDIO_DIR, exist_ok=True)
 
+# Article history and novelty filtering
+HISTORY_DB = getenv_str("HISTORY_DB", os.path.join(OUTPUT_DIR, "history.sqlite3"))
+NOVELTY_FILTER = os.getenv("NOVELTY_FILTER", "1") != "0"
+NOVELTY_WINDOW_DAYS = getenv_float("NOVELTY_WINDOW_DAYS", 3)
+NOVELTY_TITLE_SIMILARITY = getenv_float("NOVELTY_TITLE_SIMILARITY", 0.5)
+NOVELTY_EMBED_SIMILARITY = getenv_float("NOVELTY_EMBED_SIMILARITY", 0.92)
+HISTORY_RETENTION_DAYS = getenv_float("HISTORY_RETENTION_DAYS", 14)
+
+# Multi-edition batch mode
+EDITIONS_FILE = os.getenv("EDITIONS_FILE", "").strip()
+BATCH_WORKERS = getenv_int("BATCH_WORKERS", 2)
+
+
+def load_editions(path: str) -> list:
+    """Read an editions JSON file and fill in per-edition defaults and paths."""
+    with open(path) as f:
+        data = json.load(f)
+    editions = []
+    for raw in data:
+        if not raw.get("name") or not raw.get("seed"):
+            raise ValueError(f"Edition needs a name and a seed: {raw}")
+        name = raw["name"].strip().lower().replace(" ", "_")
+        editions.append({
+            "name": name,
+            "seed": raw["seed"],
+            "topic": raw.get("topic"),
+            "languages": [l.strip().lower() for l in raw.get("languages", LANGUAGES)],
+            "stage1_top_k": int(raw.get("stage1_top_k", 50)),
+            "top_k": int(raw.get("top_k", 20)),
+            "title_prefix": raw.get("title_prefix") or f"News Shorts {name.replace('_', ' ').title()}",
+            "video_file": os.path.join(OUTPUT_DIR, f"{FILE_PREFIX}_{name}.mp4"),
+            "hindi_video_file": os.path.join(OUTPUT_DIR, f"{FILE_PREFIX}_{name}_hi.mp4"),
+            "audio_dir": os.path.join(OUTPUT_DIR, f"audio_segments_{name}"),
+            "hindi_audio_dir": os.path.join(OUTPUT_DIR, f"audio_segments_{name}_hi"),
+        })
+    names = [e["name"] for e in editions]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Edition names must be unique: {names}")
+    for e in editions:
+        os.makedirs(e["audio_dir"], exist_ok=True)
+        os.makedirs(e["hindi_audio_dir"], exist_ok=True)
+    return editions
+
 VIDEO_SIZE = (
     getenv_int("VIDEO_WIDTH", 720),
     getenv_int("VIDEO_HEIGHT", 1280),
@@ -1,23 +1,80 @@
 import json
-from typing import List, Dict
+import time
+from typing import List, Dict, Optional, Sequence, Tuple
 import numpy as np
 import openai
 from . import config
+from .history import ArticleStore, article_key, title_tokens
 
 Article = Dict[str, str]
 
+DEFAULT_SEED = "India politics commerce sports technology entertainment"
+
 if config.OPENAI_KEY:
     openai.api_key = config.OPENAI_KEY
 
 
-def filter_stage1(articles: List[Article], top_k: int = 50) -> List[Article]:
-    config.logger.info("Phase 1: Semantic filtering via embeddings")
-    seed = "India politics commerce sports technology entertainment"
-    texts = [seed] + [f"{a['title']} {a['summary']}" for a in articles]
-    resp = config.with_retry(openai.embeddings.create, model="text-embedding-ada-002", input=texts)
-    embs = resp.data
-    seed_emb = np.array(embs[0].embedding)
-    art_embs = np.array([e.embedding for e in embs[1:]])
+def filter_novel(articles: List[Article], store: ArticleStore, window_days: float = config.NOVELTY_WINDOW_DAYS) -> List[Article]:
+    """Drop articles already covered, or nearly so, within *window_days*."""
+    config.logger.info(f"Phase 0: Dropping stories covered in the last {window_days:g} days")
+    since = time.time() - window_days * 86400
+    store.prune_published_index(since)
+    published = store.published_embeddings(since)
+    if published.size:
+        published = published / np.linalg.norm(published, axis=1, keepdims=True)
+        # Embeds and stores unseen articles now so stage 1 reuses them.
+        art_embs, _ = embed_articles(articles, [], store)
+    kept: List[Article] = []
+    for i, a in enumerate(articles):
+        if store.was_published(a, since):
+            config.logger.info(f"   ✖ repeat: {a['title']}")
+            continue
+        tokens = title_tokens(a["title"])
+        overlap = 0.0
+        for title in store.similar_published_titles(a["title"], since):
+            other = title_tokens(title)
+            overlap = max(overlap, len(tokens & other) / len(tokens | other))
+        if overlap >= config.NOVELTY_TITLE_SIMILARITY:
+            config.logger.info(f"   ✖ near-repeat ({overlap:.2f}): {a['title']}")
+            continue
+        if published.size:
+            emb = art_embs[i]
+            sim = float(np.max(published @ (emb / np.linalg.norm(emb))))
+            if sim >= config.NOVELTY_EMBED_SIMILARITY:
+                config.logger.info(f"   ✖ near-repeat ({sim:.2f}): {a['title']}")
+                continue
+        kept.append(a)
+    config.logger.info(f"  Kept {len(kept)}/{len(articles)} novel articles")
+    return kept
+
+
+def embed_articles(
+    articles: List[Article], seeds: Sequence[str], store: Optional[ArticleStore] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Embed *seeds* and any articles missing from *store* in a single request."""
+    cached = store.get_embeddings(articles) if store else {}
+    missing = [a for a in articles if article_key(a) not in cached]
+    texts = list(seeds) + [f"{a['title']} {a['summary']}" for a in missing]
+    embs = []
+    if texts:
+        resp = config.with_retry(openai.embeddings.create, model="text-embedding-ada-002", input=texts)
+        embs = resp.data
+    seed_embs = np.array([e.embedding for e in embs[:len(seeds)]])
+    fresh = {article_key(a): np.array(e.embedding) for a, e in zip(missing, embs[len(seeds):])}
+    if store and fresh:
+        store.put_embeddings(fresh)
+    if cached:
+        config.logger.info(f"  Reused {len(cached)} cached embeddings, requested {len(fresh)}")
+    vectors = {**cached, **fresh}
+    art_embs = np.array([vectors[article_key(a)] for a in articles])
+    return art_embs, seed_embs
+
+
+def rank_by_seed(articles: List[Article], art_embs: np.ndarray, seed_emb: np.ndarray, top_k: int = 50) -> List[Article]:
+    """Return the *top_k* articles closest to *seed_emb*."""
+    if not articles:
+        config.logger.info("  No articles to rank")
+        return []
     norms = np.linalg.norm(art_embs, axis=1) * np.linalg.norm(seed_emb)
     sims = (art_embs @ seed_emb) / norms
     idxs = np.argsort(-sims)[:top_k]
@@ -29,6 +86,17 @@ def filter_stage1(articles: List[Article], top_k: int = 50) -> List[Article]:
     return filtered
 
 
+def filter_stage1(
+    articles: List[Article], top_k: int = 50, store: Optional[ArticleStore] = None, seed: str = DEFAULT_SEED
+) -> List[Article]:
+    config.logger.info("Phase 1: Semantic filtering via embeddings")
+    if not articles:
+        config.logger.info("  No articles to rank")
+        return []
+    art_embs, seed_embs = embed_articles(articles, [seed], store)
+    return rank_by_seed(articles, art_embs, seed_embs[0], top_k)
+
+
 def filter_stage2(articles: List[Article], top_k: int = 20) -> List[Article]:
     config.logger.info("Phase 2: GPT rates newsworthiness")
     system = (
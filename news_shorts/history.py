@@ -0,0 +1,191 @@
+"""Persistent article history backed by SQLite."""
+
+import os
+import re
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Set
+import numpy as np
+from . import config
+
+Article = Dict[str, str]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    source TEXT,
+    title TEXT,
+    summary TEXT,
+    link TEXT,
+    published TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    published_at REAL,
+    embedding BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles(published_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS published_fts USING fts5(title);
+"""
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_STOPWORDS = {
+    "the", "and", "for", "with", "from", "into", "over", "after", "says", "said",
+    "are", "was", "were", "has", "have", "his", "her", "its", "this", "that",
+    "amid", "about", "will", "not", "new",
+}
+
+
+def article_key(article: Article) -> str:
+    """Return the identity used to deduplicate an article."""
+    return article["link"] or article["title"]
+
+
+def title_tokens(title: str) -> Set[str]:
+    """Return the significant lowercase words of a headline."""
+    return {
+        w for w in _WORD_RE.findall(title.lower())
+        if len(w) > 2 and w not in _STOPWORDS
+    }
+
+
+class ArticleStore:
+    """Record fetched and published articles along with their embeddings.
+
+    Every fetched article lives in ``articles``; only articles published
+    within the novelty window are indexed in ``published_fts`` so
+    near-duplicate lookups stay cheap however long the history runs.
+    """
+
+    def __init__(self, path: str = config.HISTORY_DB) -> None:
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "ArticleStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def record_fetched(self, articles: Iterable[Article]) -> None:
+        now = time.time()
+        rows = [
+            (article_key(a), a["source"], a["title"], a["summary"], a["link"], a["published"], now, now)
+            for a in articles
+            if article_key(a)
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO articles (key, source, title, summary, link, published, first_seen, last_seen)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET last_seen = excluded.last_seen",
+                rows,
+            )
+
+    def mark_published(self, articles: List[Article]) -> None:
+        self.record_fetched(articles)
+        now = time.time()
+        with self.conn:
+            for a in articles:
+                row = self.conn.execute(
+                    "SELECT id FROM articles WHERE key = ?", (article_key(a),)
+                ).fetchone()
+                if row is None:
+                    continue
+                self.conn.execute("UPDATE articles SET published_at = ? WHERE id = ?", (now, row[0]))
+                self.conn.execute("DELETE FROM published_fts WHERE rowid = ?", (row[0],))
+                self.conn.execute(
+                    "INSERT INTO published_fts (rowid, title) VALUES (?, ?)", (row[0], a["title"])
+                )
+
+    def prune_published_index(self, since: float) -> None:
+        """Drop headlines published before *since* from the near-duplicate index."""
+        with self.conn:
+            deleted = self.conn.execute(
+                "DELETE FROM published_fts WHERE rowid IN"
+                " (SELECT id FROM articles WHERE published_at < ?)",
+                (since,),
+            ).rowcount
+            if deleted:
+                # Merge away the delete markers so queries only touch live rows.
+                self.conn.execute("INSERT INTO published_fts (published_fts) VALUES ('optimize')")
+
+    def prune(self, window_days: float = config.NOVELTY_WINDOW_DAYS,
+              retention_days: float = config.HISTORY_RETENTION_DAYS) -> None:
+        """Bound the database size.
+
+        Embeddings are only kept for articles seen or published within the
+        novelty window, and rows untouched for *retention_days* are deleted.
+        """
+        now = time.time()
+        window = now - window_days * 86400
+        retention = now - max(retention_days, window_days) * 86400
+        stale = "last_seen < ? AND (published_at IS NULL OR published_at < ?)"
+        with self.conn:
+            self.conn.execute(
+                f"UPDATE articles SET embedding = NULL WHERE embedding IS NOT NULL AND {stale}",
+                (window, window),
+            )
+            self.conn.execute(
+                f"DELETE FROM published_fts WHERE rowid IN (SELECT id FROM articles WHERE {stale})",
+                (retention, retention),
+            )
+            deleted = self.conn.execute(f"DELETE FROM articles WHERE {stale}", (retention, retention)).rowcount
+        if deleted:
+            self.conn.execute("VACUUM")
+            config.logger.info(f"  Pruned {deleted} articles older than {retention_days:g} days from history")
+
+    def get_embeddings(self, articles: Iterable[Article]) -> Dict[str, np.ndarray]:
+        """Return stored embeddings keyed by article key."""
+        found: Dict[str, np.ndarray] = {}
+        for a in articles:
+            key = article_key(a)
+            row = self.conn.execute(
+                "SELECT embedding FROM articles WHERE key = ? AND embedding IS NOT NULL", (key,)
+            ).fetchone()
+            if row is not None:
+                found[key] = np.frombuffer(row[0], dtype=np.float32)
+        return found
+
+    def put_embeddings(self, embeddings: Dict[str, np.ndarray]) -> None:
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE articles SET embedding = ? WHERE key = ?",
+                [(np.asarray(v, dtype=np.float32).tobytes(), k) for k, v in embeddings.items()],
+            )
+
+    def published_embeddings(self, since: float) -> np.ndarray:
+        """Return embeddings of articles published after *since* as a matrix."""
+        rows = self.conn.execute(
+            "SELECT embedding FROM articles WHERE published_at >= ? AND embedding IS NOT NULL",
+            (since,),
+        ).fetchall()
+        if not rows:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.vstack([np.frombuffer(r[0], dtype=np.float32) for r in rows])
+
+    def was_published(self, article: Article, since: float) -> bool:
+        row = self.conn.execute(
+            "SELECT 1 FROM articles WHERE key = ? AND published_at >= ?", (article_key(article), since)
+        ).fetchone()
+        return row is not None
+
+    def similar_published_titles(self, title: str, since: float, limit: int = 5) -> List[str]:
+        """Return headlines published after *since* that share words with *title*."""
+        tokens = title_tokens(title)
+        if not tokens:
+            return []
+        query = " OR ".join(f'"{t}"' for t in sorted(tokens))
+        rows = self.conn.execute(
+            "SELECT a.title FROM published_fts f JOIN articles a ON a.id = f.rowid"
+            " WHERE published_fts MATCH ? AND a.published_at >= ?"
+            " ORDER BY f.rank LIMIT ?",
+            (query, since, limit),
+        ).fetchall()
+        return [r[0] for r in rows]
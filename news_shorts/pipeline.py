@@ -1,35 +1,201 @@
 """Main pipeline orchestrating the news short generation."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 from . import config
-from .rss import fetch_all
-from .filtering import filter_stage1, filter_stage2
+from .rss import Article, fetch_all
+from .filtering import embed_articles, filter_novel, filter_stage1, filter_stage2, rank_by_seed
+from .history import ArticleStore
 from .script_gen import craft_script, craft_hindi_script
 from .video_builder import build_video
 from .youtube_client import upload_video
 
 
+def build_videos(
+    articles: List[Article],
+    languages: List[str],
+    *,
+    video_file: str,
+    hindi_video_file: str,
+    audio_dir: str,
+    hindi_audio_dir: str,
+    topic: Optional[str] = None,
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Script and render one video per requested language.
+
+    Each language is handled on its own, so a failed Hindi script or TTS
+    call does not discard a finished English render.  Returns video paths
+    and error messages, both keyed by language.
+    """
+    topic_kwargs = {"topic": topic} if topic else {}
+    jobs = {
+        "en": (craft_script, video_file, audio_dir),
+        "hi": (craft_hindi_script, hindi_video_file, hindi_audio_dir),
+    }
+    videos: Dict[str, str] = {}
+    errors: Dict[str, str] = {}
+    for lang, (craft, video_path, lang_audio_dir) in jobs.items():
+        if lang not in languages:
+            continue
+        try:
+            segments = craft(articles, **topic_kwargs)
+            build_video(segments, video_path=video_path, audio_dir=lang_audio_dir)
+            videos[lang] = video_path
+        except Exception as exc:
+            config.logger.exception(f"Building {lang} video failed: {exc}")
+            errors[lang] = str(exc)
+    return videos, errors
+
+
+def publish_videos(
+    videos: Dict[str, str], articles: List[Article], store: ArticleStore, title_prefix: str = "News Shorts"
+) -> Dict[str, str]:
+    """Upload *videos* if enabled, recording *articles* as published once any video is out.
+
+    Returns upload error messages keyed by language.
+    """
+    errors: Dict[str, str] = {}
+    if not config.UPLOAD_TO_YOUTUBE:
+        if videos:
+            store.mark_published(articles)
+        return errors
+    titles = {"en": title_prefix, "hi": f"{title_prefix} Hindi"}
+    for lang, path in videos.items():
+        try:
+            upload_video(path, articles, title_prefix=titles[lang])
+        except Exception as exc:
+            config.logger.exception(f"Uploading {lang} video failed: {exc}")
+            errors[lang] = str(exc)
+            continue
+        store.mark_published(articles)
+    return errors
+
+
 def main() -> None:
+    if config.EDITIONS_FILE:
+        run_batch(config.EDITIONS_FILE)
+        return
+    store = ArticleStore()
     try:
         config.logger.info("🚀 Starting pipeline")
         arts_all = fetch_all()
-        arts_1 = filter_stage1(arts_all, top_k=50)
+        store.record_fetched(arts_all)
+        store.prune()
+        if config.NOVELTY_FILTER:
+            arts_all = filter_novel(arts_all, store)
+        arts_1 = filter_stage1(arts_all, top_k=50, store=store)
         arts_2 = filter_stage2(arts_1, top_k=20)
-        segments = craft_script(arts_2)
-        if "en" in config.LANGUAGES:
-            build_video(segments, video_path=config.VIDEO_FILE, audio_dir=config.AUDIO_DIR)
-            if config.UPLOAD_TO_YOUTUBE:
-                upload_video(config.VIDEO_FILE, arts_2)
-
-        if "hi" in config.LANGUAGES:
-            h_segments = craft_hindi_script(arts_2)
-            build_video(h_segments, video_path=config.HINDI_VIDEO_FILE, audio_dir=config.HINDI_AUDIO_DIR)
-            if config.UPLOAD_TO_YOUTUBE:
-                upload_video(config.HINDI_VIDEO_FILE, arts_2, title_prefix="News Shorts Hindi")
-
+        errors: Dict[str, str] = {}
+        # Publish each language before starting the next, so English goes
+        # out even if the Hindi script or TTS fails later.
+        for lang in config.LANGUAGES:
+            videos, build_errors = build_videos(
+                arts_2,
+                [lang],
+                video_file=config.VIDEO_FILE,
+                hindi_video_file=config.HINDI_VIDEO_FILE,
+                audio_dir=config.AUDIO_DIR,
+                hindi_audio_dir=config.HINDI_AUDIO_DIR,
+            )
+            errors.update(build_errors)
+            errors.update(publish_videos(videos, arts_2, store))
+        if errors:
+            raise RuntimeError(f"Failed languages: {', '.join(errors)}")
         config.logger.info(f"🎬 Completed! Output folder: {config.OUTPUT_DIR}")
     except Exception as exc:
         config.logger.exception(f"Pipeline failed: {exc}")
         raise
+    finally:
+        store.close()
+
+
+def run_edition(
+    edition: dict, articles: List[Article], art_embs: np.ndarray, seed_emb: np.ndarray
+) -> Tuple[List[Article], Dict[str, str], Dict[str, str]]:
+    """Rank, script and render a single edition from the shared ingest."""
+    config.logger.info(f"📰 Edition {edition['name']}")
+    arts_1 = rank_by_seed(articles, art_embs, seed_emb, top_k=edition["stage1_top_k"])
+    arts_2 = filter_stage2(arts_1, top_k=edition["top_k"])
+    videos, errors = build_videos(
+        arts_2,
+        edition["languages"],
+        video_file=edition["video_file"],
+        hindi_video_file=edition["hindi_video_file"],
+        audio_dir=edition["audio_dir"],
+        hindi_audio_dir=edition["hindi_audio_dir"],
+        topic=edition["topic"],
+    )
+    return arts_2, videos, errors
+
+
+def run_batch(editions_file: str = config.EDITIONS_FILE) -> Dict[str, dict]:
+    """Fetch and embed once, then produce every edition in *editions_file*.
+
+    Editions are rendered on a pool of ``BATCH_WORKERS`` threads; uploads and
+    history updates stay on the calling thread, and articles are recorded as
+    published as soon as any of their videos is uploaded.  Returns
+    per-edition results and raises once all editions have been reported if
+    any of them failed.
+    """
+    editions = config.load_editions(editions_file)
+    store = ArticleStore()
+    try:
+        config.logger.info(f"🚀 Starting batch pipeline for {len(editions)} editions")
+        arts_all = fetch_all()
+        store.record_fetched(arts_all)
+        store.prune()
+        if config.NOVELTY_FILTER:
+            arts_all = filter_novel(arts_all, store)
+        config.logger.info("Phase 1: Embedding articles and edition seeds")
+        art_embs, seed_embs = embed_articles(arts_all, [e["seed"] for e in editions], store)
+
+        results: Dict[str, dict] = {}
+        with ThreadPoolExecutor(max_workers=config.BATCH_WORKERS) as pool:
+            futures = {
+                pool.submit(run_edition, e, arts_all, art_embs, seed_embs[i]): e
+                for i, e in enumerate(editions)
+            }
+            for fut in as_completed(futures):
+                name = futures[fut]["name"]
+                try:
+                    arts_2, videos, errors = fut.result()
+                    results[name] = {"articles": arts_2, "videos": videos, "errors": errors}
+                except Exception as exc:
+                    config.logger.exception(f"Edition {name} failed: {exc}")
+                    results[name] = {"error": str(exc)}
+
+        for e in editions:
+            res = results[e["name"]]
+            if "error" in res:
+                continue
+            res["errors"].update(
+                publish_videos(res["videos"], res["articles"], store, title_prefix=e["title_prefix"])
+            )
+
+        config.logger.info("Batch results:")
+        for e in editions:
+            res = results[e["name"]]
+            if "error" in res:
+                config.logger.info(f"   ✖ {e['name']}: {res['error']}")
+                continue
+            published = [lang for lang in res["videos"] if lang not in res["errors"]]
+            summary = f"{len(res['articles'])} articles → {', '.join(published) or 'no videos'}"
+            if res["errors"]:
+                failures = "; ".join(f"{lang}: {msg}" for lang, msg in res["errors"].items())
+                config.logger.info(f"   ✖ {e['name']}: {summary} (failed {failures})")
+            else:
+                config.logger.info(f"   ✓ {e['name']}: {summary}")
+        failed = [name for name, res in results.items() if "error" in res or res["errors"]]
+        if failed:
+            raise RuntimeError(f"{len(failed)}/{len(editions)} editions failed: {', '.join(failed)}")
+        config.logger.info(f"🎬 Completed! Output folder: {config.OUTPUT_DIR}")
+        return results
+    except Exception as exc:
+        config.logger.exception(f"Batch pipeline failed: {exc}")
+        raise
+    finally:
+        store.close()
 
 
 def lambda_handler(event, context):
@@ -38,4 +204,3 @@ def lambda_handler(event, context):
 
 if __name__ == "__main__":
     main()
-
@@ -1,6 +1,7 @@
 from typing import List, Dict
 import feedparser
 from . import config
+from .history import article_key
 
 Article = Dict[str, str]
 
@@ -31,7 +32,7 @@ def fetch_all(limit_per_feed: int = config.FEED_LIMIT) -> List[Article]:
     seen = set()
     for src, url in config.RSS_SOURCES.items():
         for art in fetch_rss_feed(url, src, limit_per_feed):
-            key = art["link"] or art["title"]
+            key = article_key(art)
             if key and key not in seen:
                 seen.add(key)
                 all_arts.append(art)
@@ -13,6 +13,9 @@ if config.GEN_AI_PROVIDER == "google":
 
 Article = Dict[str, str]
 
+DEFAULT_TOPIC = "today's top five pillars: politics, commerce, sports, technology, entertainment"
+DEFAULT_HINDI_TOPIC = "today's top stories"
+
 if config.OPENAI_KEY:
     openai.api_key = config.OPENAI_KEY
 
@@ -40,13 +43,13 @@ except LookupError:
     nltk.download("punkt")
 
 
-def craft_script(articles: List[Article]) -> List[str]:
+def craft_script(articles: List[Article], topic: str = DEFAULT_TOPIC) -> List[str]:
     """Craft a monologue and split into segments."""
     config.logger.info("Step 3: Crafting & segmenting John Oliver–style script")
     base_prompt = (
         "You are John Oliver, host of Last Week Tonight. Your mission is to inform citizens with clarity and wit,"
         " never sacrificing factual accuracy or journalistic integrity.\n"
-        "Task:\n1) Write one seamless ~45-second monologue covering today's top five pillars: politics, commerce, sports, technology, entertainment."
+        f"Task:\n1) Write one seamless ~45-second monologue covering {topic}."
     )
     if config.USE_ELEVENLABS:
         extra = (
@@ -80,12 +83,12 @@ def craft_script(articles: List[Article]) -> List[str]:
         return sent_tokenize(content)
 
 
-def craft_hindi_script(articles: List[Article]) -> List[str]:
+def craft_hindi_script(articles: List[Article], topic: str = DEFAULT_HINDI_TOPIC) -> List[str]:
     """Craft a Hinglish monologue for Hindi shorts."""
     config.logger.info("Step 3H: Crafting Hinglish script")
     base_prompt = (
         "You are an energetic Hindi news anchor speaking in Hinglish (Hindi using Latin letters)."
-        " Craft a single ~45 second monologue covering today's top stories."
+        f" Craft a single ~45 second monologue covering {topic}."
     )
     if config.USE_ELEVENLABS:
         extra = (
@@ -41,7 +41,7 @@ def build_video(segments: List[str], *, video_path: str = config.VIDEO_FILE, aud
         codec="libx264",
         audio_codec="aac",
         fps=config.FPS,
-        temp_audiofile=os.path.join(config.OUTPUT_DIR, "temp-audio.m4a"),
+        temp_audiofile=os.path.splitext(video_path)[0] + "-temp-audio.m4a",
         remove_temp=True,
     )
     config.logger.info("✅ Video built!")